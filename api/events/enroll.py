@@ -20,6 +20,8 @@ from ayon_server.utils import hash_data
 
 from .router import router
 
+TOPIC_VALIDATOR = re.compile(TOPIC_REGEX)
+
 #
 # Enroll (get a new job)
 #
@@ -77,9 +79,9 @@ class EnrollRequestModel(OPModel):
 
 
 def validate_source_topic(value: str) -> str:
-    if not re.match(TOPIC_REGEX, value):
+    if not TOPIC_VALIDATOR.match(value):
         raise BadRequestException(f"Invalid topic: {value}")
-    return value.replace("*", "%")
+    return value.replace("*", "%") if "*" in value else value
 
 
 # response model must be here
@@ -112,13 +114,8 @@ async def enroll(
     if not current_user.is_service:
         raise ForbiddenException("Only services can enroll for jobs")
 
-    # source_topic
-    source_topic: str | list[str]
-
-    if isinstance(payload.source_topic, str):
-        source_topic = validate_source_topic(payload.source_topic)
-    else:
-        source_topic = [validate_source_topic(t) for t in payload.source_topic]
+    # Cheap checks first, so invalid requests fail
+    # before validating the (possibly long) list of source topics
 
     # target_topic
     if "*" in payload.target_topic:
@@ -126,16 +123,23 @@ async def enroll(
 
     # Keep DB pool size above 3
 
-    if Postgres.get_available_connections() < 3:
+    if (available_connections := Postgres.get_available_connections()) < 3:
         raise ServiceUnavailableException(
-            f"Postgres remaining pool size: {Postgres.get_available_connections()}"
+            f"Postgres remaining pool size: {available_connections}"
         )
 
+    # source_topic
+    source_topic: str | list[str]
+
+    if isinstance(payload.source_topic, str):
+        source_topic = validate_source_topic(payload.source_topic)
+    else:
+        source_topic = [validate_source_topic(t) for t in payload.source_topic]
+
     user_name = current_user.name
 
-    ignore_older: int | None = payload.ignore_older_than
-    if payload.ignore_older_than == 0:
-        ignore_older = None
+    # 0 means no limit
+    ignore_older = payload.ignore_older_than or None
 
     request_hash = hash_data(payload.dict())
     sloth()
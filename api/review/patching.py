@@ -1,3 +1,6 @@
+import re
+from typing import Any
+
 from nxtools import logging
 
 from ayon_server.api.dependencies import ActivityID, CurrentUser, ProjectName, VersionID
@@ -5,9 +8,12 @@ from ayon_server.entities import VersionEntity
 from ayon_server.exceptions import BadRequestException, NotFoundException
 from ayon_server.lib.postgres import Postgres
 from ayon_server.types import Field, OPModel
+from ayon_server.utils import EntityID
 
 from .router import router
 
+ENTITY_ID_REGEX = re.compile(EntityID.META["regex"])
+
 
 class SortReviewablesRequest(OPModel):
     sort: list[str] | None = Field(
@@ -47,42 +53,70 @@ async def sort_version_reviewables(
     version = await VersionEntity.load(project_name, version_id)
     await version.ensure_update_access(user)
 
-    res = await Postgres.fetch(
+    sort: list[str] = []
+    query_params: list[Any] = [version_id]
+    matched_column = "NULL"
+
+    if request.sort is not None:
+        for activity_id in request.sort:
+            try:
+                parsed_id = EntityID.parse(activity_id)
+            except ValueError as e:
+                raise BadRequestException(detail="Invalid reviewable ids") from e
+            if not (parsed_id and ENTITY_ID_REGEX.match(parsed_id)):
+                raise BadRequestException(detail="Invalid reviewable ids")
+            sort.append(parsed_id)
+
+        # Each reviewable may appear only once,
+        # otherwise its position is ambiguous
+        if len(sort) != len(set(sort)):
+            raise BadRequestException(detail="Duplicate reviewable ids")
+
+        matched_column = "COUNT(*) FILTER (WHERE activity_id = ANY($2::uuid[]))"
+        query_params.append(sort)
+
+    # Only the counts are needed to validate the requested order,
+    # so don't transfer the reviewable ids themselves
+
+    res = await Postgres.fetchrow(
         f"""
-        SELECT activity_id FROM project_{project_name}.activity_feed
+        SELECT COUNT(*) AS total, {matched_column} AS matched
+        FROM project_{project_name}.activity_feed
         WHERE reference_type = 'origin'
         AND activity_type = 'reviewable'
         AND entity_type = 'version'
         AND entity_id = $1
         """,
-        version_id,
+        *query_params,
     )
 
-    if not res:
+    if not res["total"]:
         raise NotFoundException(detail="Version not found")
 
     if request.sort is not None:
-        valid_ids = {row["activity_id"] for row in res}
-        requested_ids = set(request.sort)
-
-        if requested_ids != valid_ids:
-            logging.debug("Saved:", valid_ids)
-            logging.debug("Requested:", requested_ids)
+        # Every saved reviewable must be requested and nothing else
+        if not res["matched"] == res["total"] == len(sort):
+            logging.debug(
+                f"Reviewable order mismatch on version {version_id}. "
+                f"Saved: {res['total']}, matched: {res['matched']}, "
+                f"requested: {len(sort)}"
+            )
             raise BadRequestException(detail="Invalid reviewable ids")
 
-        async with Postgres.acquire() as conn, conn.transaction():
-            for i, activity_id in enumerate(request.sort):
-                await Postgres.execute(
-                    f"""
-                    UPDATE project_{project_name}.activities
-                    SET data = data || jsonb_build_object(
-                        'reviewableOrder', $1::integer
-                    )
-                    WHERE id = $2
-                    """,
-                    i,
-                    activity_id,
-                )
+        # Single set-based statement: atomic on its own,
+        # so no explicit transaction is needed
+        await Postgres.execute(
+            f"""
+            UPDATE project_{project_name}.activities AS activities
+            SET data = activities.data || jsonb_build_object(
+                'reviewableOrder', t.ord
+            )
+            FROM unnest($1::uuid[], $2::integer[]) AS t(id, ord)
+            WHERE activities.id = t.id
+            """,
+            sort,
+            list(range(len(sort))),
+        )
 
     return None
 
@@ -1,3 +1,5 @@
+from typing import Any
+
 from ayon_server.events.eventstream import EventStream
 from ayon_server.exceptions import ConstraintViolationException
 from ayon_server.lib.postgres import Postgres
@@ -47,9 +49,14 @@ async def enroll_job(
     else:
         topic_cond = "topic = ANY($1)"
 
+    # Keep the query text independent of the argument values,
+    # so the prepared statement may be reused
+    args: list[Any] = [source_topic, target_topic, max_retries]
+
     ignore_cond = ""
     if ignore_older_than is not None:
-        ignore_cond = f"AND updated_at > NOW() - INTERVAL '{ignore_older_than} days'"
+        args.append(ignore_older_than)
+        ignore_cond = "AND updated_at > NOW() - make_interval(days => $4::integer)"
 
     if sloth_mode:
         sloth_query = ", pg_sleep(0.2)"
@@ -100,7 +107,7 @@ async def enroll_job(
 
     async with Postgres.acquire() as con, con.transaction():
         statement = await con.prepare(query)
-        async for row in statement.cursor(source_topic, target_topic, max_retries):
+        async for row in statement.cursor(*args):
             # Check if target event already exists
             if row["target_status"] is not None:
                 if row["target_status"] in ["failed", "restarted"]:
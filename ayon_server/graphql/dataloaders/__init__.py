@@ -8,7 +8,6 @@ from typing import Any, NewType
 
 from ayon_server.exceptions import AyonException
 from ayon_server.lib.postgres import Postgres
-from ayon_server.utils import SQLTool
 
 KeyType = NewType("KeyType", tuple[str, str])
 KeysType = NewType("KeysType", list[KeyType])
@@ -61,13 +60,13 @@ async def folder_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
             public.projects AS pr
             ON pr.name ILIKE '{project_name}'
 
-        WHERE folders.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE folders.id = ANY($1::uuid[])
 
         GROUP BY
             folders.id, hierarchy.path, pr.attrib, ex.attrib
     """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, [k[1] for k in keys]):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -84,10 +83,10 @@ async def product_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
 
     query = f"""
         SELECT * FROM project_{project_name}.products
-        WHERE id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, [k[1] for k in keys]):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -124,10 +123,10 @@ async def task_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
         LEFT JOIN project_{project_name}.exported_attributes AS pf
         ON tasks.folder_id = pf.folder_id
 
-        WHERE tasks.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE tasks.id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, [k[1] for k in keys]):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -146,10 +145,10 @@ async def workfile_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
 
     query = f"""
         SELECT * FROM project_{project_name}.workfiles
-        WHERE id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, [k[1] for k in keys]):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -189,10 +188,10 @@ async def version_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
                 SELECT 1 FROM reviewables WHERE entity_id = v.id
             ) AS has_reviewables
         FROM project_{project_name}.versions AS v
-        WHERE v.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE v.id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, [k[1] for k in keys]):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -233,11 +232,11 @@ async def latest_version_loader(keys: list[KeyType]) -> list[dict[str, Any] | No
         WHERE v.id IN (
             SELECT l.ids[array_upper(l.ids, 1)]
             FROM project_{project_name}.version_list as l
-            WHERE l.product_id IN {SQLTool.id_array([k[1] for k in keys])}
+            WHERE l.product_id = ANY($1::uuid[])
         )
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, [k[1] for k in keys]):
         key: KeyType = KeyType((project_name, str(record["product_id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -247,7 +246,7 @@ async def user_loader(keys: list[str]) -> list[dict[str, Any] | None]:
     """Load a list of user records by their names."""
 
     result_dict = {k: None for k in keys}
-    query = f"SELECT * FROM public.users WHERE name IN {SQLTool.array(keys)}"
-    async for record in Postgres.iterate(query):
+    query = "SELECT * FROM public.users WHERE name = ANY($1::varchar[])"
+    async for record in Postgres.iterate(query, keys):
         result_dict[record["name"]] = record
     return [result_dict[k] for k in keys]
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Annotated, Any, Callable, Generator, TypeVar
+from typing import Annotated, Any, Callable, Generator, Iterable, TypeVar
 
 import strawberry
 from strawberry.arguments import StrawberryArgumentAnnotation
@@ -77,26 +77,29 @@ class FieldInfo:
                 yield from parse_fields(field.selections, fname)
 
         self.fields: list[str] = []
+        self._field_set: set[str] = set()
         for field in parse_fields(info.selected_fields):
             for root in self.roots:
                 if field.startswith(root + "."):
                     field = field.removeprefix(root + ".")
                     break
-            if field in self.fields:
+            if field in self._field_set:
                 continue
             self.fields.append(field)
+            self._field_set.add(field)
 
     def __iter__(self):
         return self.fields.__iter__()
 
     def __contains__(self, field: str) -> bool:
-        return field in self.fields
+        return field in self._field_set
 
     def has_any(self, *fields: str) -> bool:
-        for field in fields:
-            if field in self.fields:
-                return True
-        return False
+        return self.has_any_of(fields)
+
+    def has_any_of(self, fields: Iterable[str]) -> bool:
+        """Return True if any of the given fields is selected"""
+        return not self._field_set.isdisjoint(fields)
 
     def any_endswith(self, *fields: str) -> bool:
         for field in fields:
@@ -165,6 +168,12 @@ def create_pagination(
 R = TypeVar("R")
 
 
+def add_param(params: list[Any], value: Any) -> str:
+    """Register a query argument and return its placeholder"""
+    params.append(value)
+    return f"${len(params)}"
+
+
 async def resolve(
     connection_type: Callable[..., R],
     edge_type,
@@ -174,8 +183,19 @@ async def resolve(
     first: int | None = None,
     last: int | None = None,
     context: dict[str, Any] | None = None,
+    params: list[Any] | None = None,
+    loader: str | None = None,
 ) -> R:
-    """Return a connection object from a query."""
+    """Return a connection object from a query.
+
+    Query arguments ($1, $2...) may be provided using `params`.
+
+    If `loader` is set, fetched records are used to prime the data loader
+    of that name in the context, so nested fields requesting the same
+    entities don't query them again. Callers only set it when the fetched
+    rows match what the loader returns (get_versions does so only when
+    hasReviewables is selected), so most listings are not primed.
+    """
 
     if first is not None:
         count = first
@@ -184,12 +204,16 @@ async def resolve(
     else:
         count = first = DEFAULT_PAGE_SIZE
 
+    data_loader = context[loader] if (context and loader) else None
+
     edges: list[Any] = []
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, *(params or [])):
         try:
             node = node_type.from_record(project_name, record, context=context)
         except ForbiddenException:
             continue
+        if data_loader is not None:
+            data_loader.prime((project_name, str(record["id"])), record)
         cursor = record["cursor"]
         edges.append(edge_type(node=node, cursor=cursor))
         if count and count == len(edges):
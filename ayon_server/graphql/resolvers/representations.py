@@ -1,4 +1,5 @@
-from typing import Annotated
+import functools
+from typing import Annotated, Any
 
 from ayon_server.graphql.connections import RepresentationsConnection
 from ayon_server.graphql.edges import RepresentationEdge
@@ -10,6 +11,7 @@ from ayon_server.graphql.resolvers.common import (
     ARGHasLinks,
     ARGIds,
     ARGLast,
+    add_param,
     argdesc,
     create_folder_access_list,
     create_pagination,
@@ -65,41 +67,43 @@ async def get_representations(
 
     sql_joins = []
     sql_conditions = []
+    sql_params: list[Any] = []
+    param = functools.partial(add_param, sql_params)
 
     if ids is not None:
         if not ids:
             return RepresentationsConnection()
-        sql_conditions.append(f"representations.id IN {SQLTool.id_array(ids)}")
+        sql_conditions.append(f"representations.id = ANY({param(ids)}::uuid[])")
 
     if version_ids is not None:
         if not version_ids:
             return RepresentationsConnection()
         sql_conditions.append(
-            f"representations.version_id IN {SQLTool.id_array(version_ids)}"
+            f"representations.version_id = ANY({param(version_ids)}::uuid[])"
         )
     elif root.__class__.__name__ == "VersionNode":
         # cannot use isinstance here because of circular imports
-        sql_conditions.append(f"representations.version_id = '{root.id}'")
+        sql_conditions.append(f"representations.version_id = {param(root.id)}::uuid")
 
     if names is not None:
         if not names:
             return RepresentationsConnection()
         validate_name_list(names)
-        sql_conditions.append(f"representations.name IN {SQLTool.array(names)}")
+        sql_conditions.append(f"representations.name = ANY({param(names)}::varchar[])")
 
     if statuses is not None:
         if not statuses:
             return RepresentationsConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"representations.status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(
+            f"representations.status = ANY({param(statuses)}::varchar[])"
+        )
 
     if tags is not None:
         if not tags:
             return RepresentationsConnection()
         validate_name_list(tags)
-        sql_conditions.append(
-            f"representations.tags @> {SQLTool.array(tags, curly=True)}"
-        )
+        sql_conditions.append(f"representations.tags @> {param(tags)}::varchar[]")
 
     if has_links is not None:
         sql_conditions.extend(
@@ -164,6 +168,7 @@ async def get_representations(
         first,
         last,
         context=info.context,
+        params=sql_params,
     )
 
 
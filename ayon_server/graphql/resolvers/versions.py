@@ -1,5 +1,7 @@
-from typing import Annotated
+import functools
+from typing import Annotated, Any
 
+from ayon_server.exceptions import ForbiddenException
 from ayon_server.graphql.connections import VersionsConnection
 from ayon_server.graphql.edges import VersionEdge
 from ayon_server.graphql.nodes.version import VersionNode
@@ -11,6 +13,7 @@ from ayon_server.graphql.resolvers.common import (
     ARGIds,
     ARGLast,
     FieldInfo,
+    add_param,
     argdesc,
     create_folder_access_list,
     create_pagination,
@@ -19,7 +22,12 @@ from ayon_server.graphql.resolvers.common import (
     sortdesc,
 )
 from ayon_server.graphql.types import Info
-from ayon_server.types import validate_name_list, validate_status_list
+from ayon_server.lib.postgres import Postgres
+from ayon_server.types import (
+    validate_name,
+    validate_name_list,
+    validate_status_list,
+)
 from ayon_server.utils import SQLTool
 
 SORT_OPTIONS = {
@@ -29,6 +37,60 @@ SORT_OPTIONS = {
     "updatedAt": "versions.updated_at",
 }
 
+CURSOR_FIELDS = frozenset(
+    {
+        "versions.pageInfo.startCursor",
+        "versions.pageInfo.endCursor",
+        "versions.edges.cursor",
+    }
+)
+
+# Passing this as the only ID returns an empty result without querying
+EMPTY_OVERRIDE_ID = "0" * 32
+
+VERSION_COLUMNS = [
+    "versions.id AS id",
+    "versions.version AS version",
+    "versions.product_id AS product_id",
+    "versions.task_id AS task_id",
+    "versions.thumbnail_id AS thumbnail_id",
+    "versions.author AS author",
+    "versions.attrib AS attrib",
+    "versions.data AS data",
+    "versions.status AS status",
+    "versions.tags AS tags",
+    "versions.active AS active",
+    "versions.created_at AS created_at",
+    "versions.updated_at AS updated_at",
+    "versions.creation_order AS creation_order",
+]
+
+
+def get_has_reviewables_column(schema: str) -> str:
+    """Return a column expression telling whether a version has reviewables"""
+    return f"""
+        EXISTS (
+            SELECT 1 FROM {schema}.activity_feed
+            WHERE entity_type = 'version'
+            AND   activity_type = 'reviewable'
+            AND   entity_id = versions.id
+        ) AS has_reviewables
+    """
+
+
+def get_access_joins(schema: str) -> list[str]:
+    """Return joins needed to filter versions by the folder access list"""
+    return [
+        f"""
+        INNER JOIN {schema}.products AS products
+        ON products.id = versions.product_id
+        """,
+        f"""
+        INNER JOIN {schema}.hierarchy AS hierarchy
+        ON hierarchy.id = products.folder_id
+        """,
+    ]
+
 
 async def get_versions(
     root,
@@ -74,113 +136,95 @@ async def get_versions(
     """Return a list of versions."""
 
     project_name = root.project_name
+    schema = f"project_{project_name}"
+    # Node classes cannot be imported here (they import this module),
+    # so the parent type is resolved by name - once.
+    root_type = root.__class__.__name__
     fields = FieldInfo(info, ["versions.edges.node", "version"])
 
     #
     # SQL
     #
-    sql_cte = []
-
-    sql_columns = [
-        "versions.id AS id",
-        "versions.version AS version",
-        "versions.product_id AS product_id",
-        "versions.task_id AS task_id",
-        "versions.thumbnail_id AS thumbnail_id",
-        "versions.author AS author",
-        "versions.attrib AS attrib",
-        "versions.data AS data",
-        "versions.status AS status",
-        "versions.tags AS tags",
-        "versions.active AS active",
-        "versions.created_at AS created_at",
-        "versions.updated_at AS updated_at",
-        "versions.creation_order AS creation_order",
-    ]
 
-    if fields.any_endswith("hasReviewables"):
-        sql_cte.append(
-            f"""
-            reviewables AS (
-                SELECT entity_id FROM project_{project_name}.activity_feed
-                WHERE entity_type = 'version'
-                AND   activity_type = 'reviewable'
-            )
-            """
-        )
+    sql_columns = list(VERSION_COLUMNS)
 
-        sql_columns.append(
-            """
-            EXISTS (
-            SELECT 1 FROM reviewables WHERE entity_id = versions.id
-            ) AS has_reviewables
-            """
-        )
+    has_reviewables = fields.any_endswith("hasReviewables")
+    if has_reviewables:
+        sql_columns.append(get_has_reviewables_column(schema))
 
     sql_conditions = []
     sql_joins = []
+    sql_params: list[Any] = []
+    param = functools.partial(add_param, sql_params)
 
     # Empty overrides. Skip querying
-    if ids == ["0" * 32]:
+    if ids and len(ids) == 1 and ids[0] == EMPTY_OVERRIDE_ID:
         return VersionsConnection(edges=[])
 
     if ids is not None:
         if not ids:
             return VersionsConnection()
-        sql_conditions.append(f"versions.id IN {SQLTool.id_array(ids)}")
+        sql_conditions.append(f"versions.id = ANY({param(ids)}::uuid[])")
     if version:
-        sql_conditions.append(f"versions.version = {version}")
+        sql_conditions.append(f"versions.version = {param(version)}::integer")
     if versions is not None:
         if not versions:
             return VersionsConnection()
-        sql_conditions.append(f"versions.version IN {SQLTool.array(versions)}")
+        sql_conditions.append(f"versions.version = ANY({param(versions)}::integer[])")
     if authors is not None:
         if not authors:
             return VersionsConnection()
         validate_name_list(authors)
-        sql_conditions.append(f"versions.author IN {SQLTool.array(authors)}")
+        sql_conditions.append(f"versions.author = ANY({param(authors)}::varchar[])")
     if statuses is not None:
         if not statuses:
             return VersionsConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"versions.status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(f"versions.status = ANY({param(statuses)}::varchar[])")
     if tags is not None:
         if not tags:
             return VersionsConnection()
         validate_name_list(tags)
-        sql_conditions.append(f"versions.tags @> {SQLTool.array(tags, curly=True)}")
+        sql_conditions.append(f"versions.tags @> {param(tags)}::varchar[]")
 
     if product_ids is not None:
         if not product_ids:
             return VersionsConnection()
-        sql_conditions.append(f"versions.product_id IN {SQLTool.id_array(product_ids)}")
-    elif root.__class__.__name__ == "ProductNode":
-        sql_conditions.append(f"versions.product_id = '{root.id}'")
+        sql_conditions.append(
+            f"versions.product_id = ANY({param(product_ids)}::uuid[])"
+        )
+    elif root_type == "ProductNode":
+        sql_conditions.append(f"versions.product_id = {param(root.id)}::uuid")
     if task_ids:
-        sql_conditions.append(f"versions.task_id IN {SQLTool.id_array(task_ids)}")
-    elif root.__class__.__name__ == "TaskNode":
-        sql_conditions.append(f"versions.task_id = '{root.id}'")
+        sql_conditions.append(f"versions.task_id = ANY({param(task_ids)}::uuid[])")
+    elif root_type == "TaskNode":
+        sql_conditions.append(f"versions.task_id = {param(root.id)}::uuid")
 
-    if latestOnly:
-        sql_conditions.append(
+    # version_list has a unique index on product_id, so joining it
+    # is a single index lookup per row instead of scanning the whole view
+
+    if latestOnly or heroOrLatestOnly:
+        sql_joins.append(
             f"""
-            versions.id IN (
-            SELECT l.ids[array_upper(l.ids, 1)]
-            FROM project_{project_name}.version_list as l
-            )
+            LEFT JOIN {schema}.version_list AS version_list
+            ON version_list.product_id = versions.product_id
             """
         )
+
+    if latestOnly:
+        sql_conditions.append(
+            "versions.id = version_list.ids[array_upper(version_list.ids, 1)]"
+        )
     elif heroOnly:
         sql_conditions.append("versions.version < 0")
 
     elif heroOrLatestOnly:
         sql_conditions.append(
-            f"""
+            """
             (versions.version < 0
-            OR versions.id IN (
-                SELECT l.ids[array_upper(l.ids, 1)]
-                FROM project_{project_name}.version_list as l
-                WHERE l.versions[1] >= 0
+            OR (
+                versions.id = version_list.ids[array_upper(version_list.ids, 1)]
+                AND version_list.versions[1] >= 0
             )
             )
             """
@@ -193,22 +237,10 @@ async def get_versions(
 
     access_list = await create_folder_access_list(root, info)
     if access_list is not None:
-        sql_conditions.append(
-            f"hierarchy.path like ANY ('{{ {','.join(access_list)} }}')"
-        )
-
-        sql_joins.extend(
-            [
-                f"""
-                INNER JOIN project_{project_name}.products AS products
-                ON products.id = versions.product_id
-                """,
-                f"""
-                INNER JOIN project_{project_name}.hierarchy AS hierarchy
-                ON hierarchy.id = products.folder_id
-                """,
-            ]
-        )
+        # access list items are quoted for use in array literals
+        paths = [path.strip('"') for path in access_list]
+        sql_conditions.append(f"hierarchy.path LIKE ANY({param(paths)}::text[])")
+        sql_joins.extend(get_access_joins(schema))
 
     #
     # Pagination
@@ -219,16 +251,15 @@ async def get_versions(
         if sort_by in SORT_OPTIONS:
             order_by.insert(0, SORT_OPTIONS[sort_by])
         elif sort_by.startswith("attrib."):
-            order_by.insert(0, f"versions.attrib->>'{sort_by[7:]}'")
+            # attribute name cannot be passed as an argument
+            # because it is a part of the cursor expression
+            attr_name = validate_name(sort_by[7:])
+            order_by.insert(0, f"versions.attrib->>'{attr_name}'")
         else:
             raise ValueError(f"Invalid sort_by value: {sort_by}")
 
     paging_fields = FieldInfo(info, ["versions"])
-    need_cursor = paging_fields.has_any(
-        "versions.pageInfo.startCursor",
-        "versions.pageInfo.endCursor",
-        "versions.edges.cursor",
-    )
+    need_cursor = paging_fields.has_any_of(CURSOR_FIELDS)
 
     pagination, paging_conds, cursor = create_pagination(
         order_by,
@@ -244,16 +275,9 @@ async def get_versions(
     # Query
     #
 
-    if sql_cte:
-        cte = ", ".join(sql_cte)
-        cte = f"WITH {cte}"
-    else:
-        cte = ""
-
     query = f"""
-        {cte}
         SELECT {cursor}, {", ".join(sql_columns)}
-        FROM project_{project_name}.versions AS versions
+        FROM {schema}.versions AS versions
         {" ".join(sql_joins)}
         {SQLTool.conditions(sql_conditions)}
         {pagination}
@@ -268,14 +292,75 @@ async def get_versions(
         first,
         last,
         context=info.context,
+        params=sql_params,
+        # version_loader records always contain has_reviewables,
+        # so only complete rows may be used to prime it. Listings which
+        # don't select hasReviewables are not primed at all.
+        loader="version_loader" if has_reviewables else None,
     )
 
 
+@functools.lru_cache(maxsize=512)
+def get_version_query(
+    project_name: str,
+    has_reviewables: bool,
+    check_access: bool,
+) -> str:
+    """Build a query for loading a single version by its ID.
+
+    The query depends only on its shape and the project, so it is built
+    once and reused. Version ID is passed as $1, list of accessible
+    folder paths (when `check_access` is set) as $2.
+    """
+
+    schema = f"project_{project_name}"
+
+    sql_columns = list(VERSION_COLUMNS)
+    sql_conditions = ["versions.id = $1"]
+    sql_joins = []
+
+    if has_reviewables:
+        sql_columns.append(get_has_reviewables_column(schema))
+
+    if check_access:
+        sql_conditions.append("hierarchy.path LIKE ANY($2::text[])")
+        sql_joins.extend(get_access_joins(schema))
+
+    return f"""
+        SELECT {", ".join(sql_columns)}
+        FROM {schema}.versions AS versions
+        {" ".join(sql_joins)}
+        {SQLTool.conditions(sql_conditions)}
+    """
+
+
 async def get_version(root, info: Info, id: str) -> VersionNode | None:
-    """Return a task node based on its ID"""
+    """Return a version node based on its ID"""
     if not id:
         return None
-    connection = await get_versions(root, info, ids=[id])
-    if not connection.edges:
+
+    # Single row lookup by primary key. This does not need
+    # the filtering and pagination machinery of get_versions
+
+    project_name = root.project_name
+    fields = FieldInfo(info, ["version"])
+    access_list = await create_folder_access_list(root, info)
+
+    query = get_version_query(
+        project_name,
+        has_reviewables=fields.any_endswith("hasReviewables"),
+        check_access=access_list is not None,
+    )
+
+    args: list[Any] = [id]
+    if access_list is not None:
+        # access list items are quoted for use in array literals
+        args.append([path.strip('"') for path in access_list])
+
+    record = await Postgres.fetchrow(query, *args)
+    if record is None:
+        return None
+    try:
+        return VersionNode.from_record(project_name, record, context=info.context)
+    except ForbiddenException:
         return None
-    return connection.edges[0].node
@@ -1,42 +1,86 @@
+import time
+
 from ayon_server.lib.postgres import Postgres
 
+# Queries are kept as constant strings, so asyncpg's per-connection
+# statement cache keeps them prepared across calls on every pooled connection.
+
+GET_SECRET_QUERY = "SELECT value FROM secrets WHERE name = $1"
+SET_SECRET_QUERY = """
+    INSERT INTO secrets (name, value) VALUES ($1, $2)
+    ON CONFLICT (name) DO UPDATE SET value = $2
+"""
+DELETE_SECRET_QUERY = "DELETE FROM secrets WHERE name = $1"
+ALL_SECRETS_QUERY = "SELECT name, value FROM secrets"
+
+# Secrets rarely change, so lookups are cached in-process for a short time.
+# Values never leave the process. set/delete invalidate the cache of the
+# worker that handled them immediately; other workers may keep serving
+# the previous value until SECRETS_CACHE_TTL expires.
+# Missing secrets are not cached, so a newly created secret is visible at once.
+
+SECRETS_CACHE_TTL = 10
+
 
 class Secrets:
+    _cache: dict[str, tuple[float, str]] = {}
+    _all_cache: tuple[float, dict[str, str]] | None = None
+    # Bumped on every write. A lookup started before a write must not
+    # store the value it read, as it may predate the write.
+    _generation: int = 0
+
+    @classmethod
+    def _invalidate(cls, key: str) -> None:
+        cls._generation += 1
+        cls._cache.pop(key, None)
+        cls._all_cache = None
+
     @classmethod
     async def get(cls, key: str) -> str | None:
         """
         Get a secret. Return None if it doesn't exist.
         """
-        query = "SELECT value FROM secrets WHERE name = $1"
-        res = await Postgres.fetch(query, key)
+        now = time.monotonic()
+        if (cached := cls._cache.get(key)) and cached[0] > now:
+            return cached[1]
+
+        generation = cls._generation
+        res = await Postgres.fetchrow(GET_SECRET_QUERY, key)
         if not res:
             return None
-        return res[0]["value"]
+        value = res["value"]
+        if generation == cls._generation:
+            cls._cache[key] = (now + SECRETS_CACHE_TTL, value)
+        return value
 
     @classmethod
     async def set(cls, key: str, value: str):
         """
         Set a secret. Create it if it doesn't exist.
         """
-        query = """
-            INSERT INTO secrets (name, value) VALUES ($1, $2)
-            ON CONFLICT (name) DO UPDATE SET value = $2
-        """
-        await Postgres.execute(query, key, value)
+        await Postgres.execute(SET_SECRET_QUERY, key, value)
+        cls._invalidate(key)
 
     @classmethod
     async def delete(cls, key: str):
         """
         Delete a secret.
         """
-        query = "DELETE FROM secrets WHERE name = $1"
-        await Postgres.execute(query, key)
+        await Postgres.execute(DELETE_SECRET_QUERY, key)
+        cls._invalidate(key)
 
     @classmethod
     async def all(cls) -> dict[str, str]:
         """
         Return a dictionary of all secrets.
         """
-        query = "SELECT * FROM secrets"
-        res = await Postgres.fetch(query)
-        return {row["name"]: row["value"] for row in res}
+        now = time.monotonic()
+        if cls._all_cache and cls._all_cache[0] > now:
+            return dict(cls._all_cache[1])
+
+        generation = cls._generation
+        res = await Postgres.fetch(ALL_SECRETS_QUERY)
+        result = {row["name"]: row["value"] for row in res}
+        if generation == cls._generation:
+            cls._all_cache = (now + SECRETS_CACHE_TTL, result)
+        return dict(result)
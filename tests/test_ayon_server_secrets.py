@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from ayon_server import secrets
+from ayon_server.secrets import SECRETS_CACHE_TTL, Secrets
+
+
+class FakePostgres:
+    def __init__(self):
+        self.secrets: dict[str, str] = {}
+        self.queries = 0
+        # When set, reads wait for it, so writes can interleave with them
+        self.read_gate: asyncio.Event | None = None
+
+    async def _read(self) -> None:
+        self.queries += 1
+        if self.read_gate is not None:
+            await self.read_gate.wait()
+
+    async def fetchrow(self, query: str, name: str) -> dict[str, str] | None:
+        value = self.secrets.get(name)
+        await self._read()
+        return None if value is None else {"value": value}
+
+    async def fetch(self, query: str) -> list[dict[str, str]]:
+        rows = [{"name": k, "value": v} for k, v in self.secrets.items()]
+        await self._read()
+        return rows
+
+    async def execute(self, query: str, name: str, value: str | None = None) -> None:
+        if value is None:
+            self.secrets.pop(name, None)
+        else:
+            self.secrets[name] = value
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def postgres(monkeypatch):
+    postgres = FakePostgres()
+    monkeypatch.setattr(secrets, "Postgres", postgres)
+    monkeypatch.setattr(Secrets, "_cache", {})
+    monkeypatch.setattr(Secrets, "_all_cache", None)
+    return postgres
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(secrets, "time", clock)
+    return clock
+
+
+class TestSecretsCache:
+    def test_get_is_cached_until_ttl(self, postgres, clock):
+        postgres.secrets["token"] = "abc"
+
+        assert asyncio.run(Secrets.get("token")) == "abc"
+        assert asyncio.run(Secrets.get("token")) == "abc"
+        assert postgres.queries == 1
+
+        clock.now += SECRETS_CACHE_TTL + 1
+        assert asyncio.run(Secrets.get("token")) == "abc"
+        assert postgres.queries == 2
+
+    def test_missing_secret_is_not_cached(self, postgres, clock):
+        assert asyncio.run(Secrets.get("token")) is None
+        postgres.secrets["token"] = "abc"
+        assert asyncio.run(Secrets.get("token")) == "abc"
+
+    def test_set_invalidates(self, postgres, clock):
+        postgres.secrets["token"] = "abc"
+        asyncio.run(Secrets.get("token"))
+        asyncio.run(Secrets.all())
+
+        asyncio.run(Secrets.set("token", "def"))
+        assert asyncio.run(Secrets.get("token")) == "def"
+        assert asyncio.run(Secrets.all()) == {"token": "def"}
+
+    def test_delete_invalidates(self, postgres, clock):
+        postgres.secrets["token"] = "abc"
+        asyncio.run(Secrets.get("token"))
+        asyncio.run(Secrets.all())
+
+        asyncio.run(Secrets.delete("token"))
+        assert asyncio.run(Secrets.get("token")) is None
+        assert asyncio.run(Secrets.all()) == {}
+
+    def test_get_does_not_cache_value_read_before_set(self, postgres, clock):
+        postgres.secrets["token"] = "abc"
+
+        async def race() -> str | None:
+            postgres.read_gate = asyncio.Event()
+            lookup = asyncio.create_task(Secrets.get("token"))
+            await asyncio.sleep(0)  # the lookup has read the old row
+            await Secrets.set("token", "def")
+            postgres.read_gate.set()
+            result = await lookup
+            postgres.read_gate = None
+            return result
+
+        assert asyncio.run(race()) == "abc"
+        assert asyncio.run(Secrets.get("token")) == "def"
+
+    def test_all_does_not_cache_rows_read_before_set(self, postgres, clock):
+        postgres.secrets["token"] = "abc"
+
+        async def race() -> dict[str, str]:
+            postgres.read_gate = asyncio.Event()
+            lookup = asyncio.create_task(Secrets.all())
+            await asyncio.sleep(0)
+            await Secrets.set("token", "def")
+            postgres.read_gate.set()
+            result = await lookup
+            postgres.read_gate = None
+            return result
+
+        assert asyncio.run(race()) == {"token": "abc"}
+        assert asyncio.run(Secrets.all()) == {"token": "def"}